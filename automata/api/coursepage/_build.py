@@ -61,7 +61,7 @@ def _load_materials(materials_path, output_path):
     """
 
     # read the universe
-    with (materials_path / "materials.json").open() as fileobj:
+    with (materials_path / "materials.json").open(encoding="utf-8") as fileobj:
         materials = automata.lib.materials.deserialize(fileobj.read())
 
     # we need to update their paths to be relative to output directory; this function
@@ -124,8 +124,8 @@ def _load_config(path, vars=None):
 
 def _validate_theme_schema(input_path, config):
     """Validate a config against the theme's schema."""
-    with (input_path / "theme" / "schema.yaml").open() as fileobj:
-        theme_schema = yaml.load(fileobj, Loader=yaml.Loader)
+    with (input_path / "theme" / "schema.yaml").open("rb") as fileobj:
+        theme_schema = yaml.load(fileobj, Loader=util.SafeLoader)
 
     try:
         dictconfig.resolve(config["theme"], theme_schema)
@@ -157,10 +157,18 @@ def _find_input_pages(input_path):
         yield contents, relpath
 
 
-def _interpolate(contents, variables, path=None):
-    template = jinja2.Template(contents, undefined=jinja2.StrictUndefined,
-            variable_start_string="${", variable_end_string="}",
-            block_start_string="{%", block_end_string="%}")
+# pages and the theme's base template are written with ${ } delimiters
+_PAGE_ENVIRONMENT = jinja2.Environment(
+    undefined=jinja2.StrictUndefined,
+    variable_start_string="${",
+    variable_end_string="}",
+    block_start_string="{%",
+    block_end_string="%}",
+)
+
+
+def _interpolate(template, variables, path=None):
+    """Render a page template, compiled by _PAGE_ENVIRONMENT.from_string."""
     try:
         return template.render(**variables)
     except jinja2.UndefinedError as exc:
@@ -173,8 +181,9 @@ def _to_html(contents):
 
 def _render_pages(input_path, output_path, theme_path, context):
     """Render each file in the input path into an HTML file in the output path."""
+    # the base template is the same for every page, so it is compiled only once
     with (theme_path / "base.html").open() as fileobj:
-        template = fileobj.read()
+        base_template = _PAGE_ENVIRONMENT.from_string(fileobj.read())
 
     _Elements = collections.namedtuple(
         "Elements", ["announcement_box", "schedule", "listing", "people"]
@@ -194,12 +203,14 @@ def _render_pages(input_path, output_path, theme_path, context):
         input_page_relpath = input_page_abspath.relative_to(input_path)
 
         body_interpolated = _interpolate(
-            input_page_contents,
+            _PAGE_ENVIRONMENT.from_string(input_page_contents),
             {"elements": elements_, **context._asdict()},
             path=input_page_abspath,
         )
         body_html = _to_html(body_interpolated)
-        page_html = _interpolate(template, {"body": body_html, **context._asdict()})
+        page_html = _interpolate(
+            base_template, {"body": body_html, **context._asdict()}
+        )
 
         output_page_abspath = (output_path / input_page_relpath).with_suffix(".html")
         with output_page_abspath.open("w") as fileobj:
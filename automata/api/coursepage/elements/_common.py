@@ -1,3 +1,5 @@
+import functools
+
 import dictconfig
 import markdown
 import jinja2
@@ -5,12 +7,67 @@ import jinja2
 from .. import exceptions
 
 
-def render_element_template(template_name, context, extra_vars=None):
-    if extra_vars is None:
-        extra_vars = {}
+# template strings in element configurations are written with $( ) delimiters so
+# that they are not confused with the ${ } of the element templates themselves
+_EVALUATE_ENVIRONMENT = jinja2.Environment(
+    undefined=jinja2.StrictUndefined,
+    variable_start_string='$(',
+    variable_end_string=')',
+    block_start_string='(%',
+    block_end_string='%)',
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_template_string(s):
+    """Compile a template string. Each distinct string is compiled only once.
+
+    An element evaluates the same template string (e.g., a listing's title) for
+    every publication it displays, so the compiled template is cached.
 
+    """
+    return _EVALUATE_ENVIRONMENT.from_string(s)
+
+
+@jinja2.pass_context
+def _evaluate(jinja_context, s, **kwargs):
+    # the render context is available to element templates as "context"
+    if 'context' not in kwargs:
+        kwargs['context'] = jinja_context['context']
+
+    try:
+        return _compile_template_string(s).render(**kwargs)
+    except jinja2.UndefinedError as exc:
+        raise exceptions.ElementError(
+            f'Unknown variable in template string "{s}": {exc}'
+        )
+
+
+def _get_dotted_attr(obj, path):
+    for part in path.split('.'):
+        try:
+            obj = obj[part]
+        except TypeError:
+            obj = getattr(obj, part)
+
+    return obj
+
+
+def _markdown_to_html(s):
+    return markdown.markdown(s)
+
+
+@functools.lru_cache(maxsize=None)
+def _element_environment(elements_path):
+    """The environment for the element templates in a theme. Made once per theme.
+
+    Reusing the environment lets jinja2 keep its compiled templates between
+    renders, instead of parsing an element's template every time it is used.
+    Templates are still reloaded if their files change.
+
+    """
     element_environment = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(context.theme_path / "elements"),
+        loader=jinja2.FileSystemLoader(elements_path),
         undefined=jinja2.StrictUndefined,
         variable_start_string='${',
         variable_end_string='}',
@@ -18,41 +75,18 @@ def render_element_template(template_name, context, extra_vars=None):
         block_end_string='%}',
     )
 
-    def evaluate(s, **kwargs):
-        if 'context' not in kwargs:
-            kwargs['context'] = context
+    element_environment.filters["evaluate"] = _evaluate
+    element_environment.filters["markdown_to_html"] = _markdown_to_html
+    element_environment.filters["get_dotted_attr"] = _get_dotted_attr
 
-        try:
-            return jinja2.Template(s, undefined=jinja2.StrictUndefined,
-                variable_start_string='$(',
-                variable_end_string=')',
-                block_start_string='(%',
-                block_end_string='%)'
-                    ).render(**kwargs)
-        except jinja2.UndefinedError as exc:
-            raise exceptions.ElementError(
-                f'Unknown variable in template string "{s}": {exc}'
-            )
-
-    def get_dotted_attr(obj, path):
-        parts = list(reversed(path.split('.')))
-
-        while parts:
-            part = parts.pop()
-            try:
-                obj = obj[part]
-            except TypeError:
-                obj = getattr(obj, part)
-
-        return obj
-
-    def markdown_to_html(s):
-        return markdown.markdown(s)
-
-    element_environment.filters["evaluate"] = evaluate
-    element_environment.filters["markdown_to_html"] = markdown_to_html
-    element_environment.filters["get_dotted_attr"] = get_dotted_attr
+    return element_environment
+
+
+def render_element_template(template_name, context, extra_vars=None):
+    if extra_vars is None:
+        extra_vars = {}
 
+    element_environment = _element_environment(context.theme_path / "elements")
     template = element_environment.get_template(template_name)
     return template.render(context=context, **extra_vars)
 
@@ -121,6 +121,9 @@ ONE_WEEK = datetime.timedelta(weeks=1)
 
 
 def _publication_within_week(start_date, date_key):
+    # the filter is called for every node in the collection; compute the end once
+    end_date = start_date + ONE_WEEK
+
     def filter(key, node):
         if not isinstance(node, automata.lib.materials.Publication):
             return True
@@ -129,7 +132,7 @@ def _publication_within_week(start_date, date_key):
             if isinstance(date, datetime.datetime):
                 date = date.date()
 
-            return start_date <= date < start_date + ONE_WEEK
+            return start_date <= date < end_date
 
     return filter
 
@@ -169,5 +169,5 @@ def publish(
     published = mlib.publish(built, output_directory, callbacks=CLIPublishCallbacks())
 
     # serialize the results
-    with (output_directory / "materials.json").open("w") as fileobj:
+    with (output_directory / "materials.json").open("w", encoding="utf-8") as fileobj:
         fileobj.write(mlib.serialize(published))
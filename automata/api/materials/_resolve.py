@@ -1,3 +1,4 @@
+import os
 import pathlib
 
 from ...lib.materials import read_collection_file, read_publication_file, discover
@@ -56,8 +57,24 @@ def _find_parent_collection_root(dir_path):
     return _find_parent_collection_root(dir_path.parent)
 
 
+def _find_publication_files(root):
+    """Yield the paths of all publication files beneath the root directory.
+
+    Uses os.scandir, whose entries know whether they are directories without an
+    extra stat() call. Like a ``**`` glob, symbolic links to directories are not
+    followed.
+
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _find_publication_files(entry.path)
+            elif entry.name == constants.PUBLICATION_FILE:
+                yield pathlib.Path(entry.path)
+
+
 def _find_previous(this_publication_path, collection_root):
-    all_publications = sorted(pathlib.Path(collection_root).glob('**/publication.yaml'))
+    all_publications = sorted(_find_publication_files(collection_root))
     all_publications = [p.resolve() for p in all_publications]
     index = all_publications.index(this_publication_path.resolve())
     if index == 0:
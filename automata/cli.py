@@ -1,17 +1,12 @@
 import argparse
 import datetime
-import json
+import functools
 import pathlib
 import sys
 
-import yaml
-
-import automata.api.materials
-import automata.api.coursepage
-import automata.api.sync
-import automata.lib.materials
-
-from automata import util
+# the api packages, and the libraries they depend on (yaml, jinja2, dictconfig,
+# markdown), are imported by the subcommands that use them. this way a command
+# only pays for the imports it needs
 
 
 def _arg_directory(s):
@@ -45,6 +40,17 @@ def _usage_printer(parser):
 
 
 def _parse_args(argv):
+    return _make_parser().parse_args(argv)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_parser():
+    """Build the argument parser. It is built once and reused by every call to cli.
+
+    Because the parser is reused, argument defaults must not depend on the state of
+    the process when the parser is built (e.g., the current working directory).
+
+    """
     parser = argparse.ArgumentParser()
     parser.set_defaults(cmd=_usage_printer(parser))
 
@@ -54,9 +60,7 @@ def _parse_args(argv):
     _register_coursepage_parser(subparsers)
     _register_sync_parser(subparsers)
 
-    args = parser.parse_args(argv)
-
-    return args
+    return parser
 
 
 def _register_materials_parser(subparsers):
@@ -74,9 +78,15 @@ def _register_materials_publish_parser(subparsers):
     parser = subparsers.add_parser("publish")
 
     def cmd(args):
+        import automata.api.materials
+        from automata import util
+
         if args.vars is not None:
             args.vars = util.load_yaml(args.vars)
 
+        if args.input_directory is None:
+            args.input_directory = pathlib.Path.cwd()
+
         return automata.api.materials.publish(
             args.input_directory,
             args.output_directory,
@@ -92,7 +102,10 @@ def _register_materials_publish_parser(subparsers):
     parser.set_defaults(cmd=cmd)
     parser.add_argument("output_directory", type=_arg_output_directory)
     parser.add_argument(
-        "--input-directory", type=_arg_directory, default=pathlib.Path.cwd()
+        "--input-directory",
+        type=_arg_directory,
+        default=None,
+        help="defaults to the current working directory",
     )
     parser.add_argument(
         "--skip-directories",
@@ -137,6 +150,12 @@ def _register_materials_resolve_parser(subparsers):
     parser = subparsers.add_parser("resolve")
 
     def cmd(args):
+        import yaml
+
+        import automata.api.materials
+        import automata.lib.materials
+        from automata import util
+
         if args.vars is not None:
             args.vars = util.load_yaml(args.vars)
 
@@ -179,6 +198,9 @@ def _register_materials_status_parser(subparsers):
     parser.add_argument("--vars", type=pathlib.Path)
 
     def cmd(args):
+        import automata.api.materials
+        from automata import util
+
         if args.vars is not None:
             args.vars = util.load_yaml(args.vars)
 
@@ -204,16 +226,25 @@ def _register_coursepage_build_parser(subparsers):
     parser = subparsers.add_parser("build")
 
     parser.add_argument("output_directory")
-    parser.add_argument("--input-directory", default=pathlib.Path.cwd())
+    parser.add_argument(
+        "--input-directory",
+        default=None,
+        help="defaults to the current working directory",
+    )
     parser.add_argument("--materials")
     parser.add_argument("--now")
     parser.add_argument("--vars", type=pathlib.Path)
 
     def cmd(args):
+        import yaml
+
+        import automata.api.coursepage
+        from automata import util
+
         vars = {}
         if args.vars is not None:
-            with args.vars.open() as fileobj:
-                vars = yaml.load(fileobj, Loader=yaml.Loader)
+            with args.vars.open("rb") as fileobj:
+                vars = yaml.load(fileobj, Loader=util.SafeLoader)
 
         if args.now is None:
             now = datetime.datetime.now
@@ -229,6 +260,9 @@ def _register_coursepage_build_parser(subparsers):
 
             print(f"Running as if it is currently {_now}")
 
+        if args.input_directory is None:
+            args.input_directory = pathlib.Path.cwd()
+
         automata.api.coursepage.build(
             args.input_directory,
             args.output_directory,
@@ -244,6 +278,8 @@ def _register_coursepage_init_parser(subparsers):
     parser = subparsers.add_parser("init")
 
     def cmd(args):
+        import automata.api.coursepage
+
         automata.api.coursepage.initialize(args.output_path)
 
     parser.add_argument("output_path")
@@ -265,6 +301,8 @@ def _register_sync_git_branch_parser(subparsers):
     parser.add_argument('branch')
 
     def cmd(args):
+        import automata.api.sync
+
         return automata.api.sync.git(args.local_directory, args.git_repo_url, args.branch)
 
     parser.set_defaults(cmd=cmd)
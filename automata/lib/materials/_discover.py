@@ -1,5 +1,7 @@
+import os
 import pathlib
-from collections import deque, OrderedDict
+import sys
+from collections import deque
 
 import dictconfig
 import yaml
@@ -15,6 +17,14 @@ from .exceptions import DiscoveryError
 from . import constants
 
 
+# collection and publication files are plain data, so they are read with the safe
+# loader -- libyaml's C version when PyYAML has it
+try:
+    _SafeLoader = yaml.CSafeLoader
+except AttributeError:
+    _SafeLoader = yaml.SafeLoader
+
+
 # read_collection_file
 # --------------------------------------------------------------------------------------
 
@@ -40,8 +50,8 @@ def read_collection_file(path, vars=None):
     if vars is None:
         vars = {}
 
-    with path.open() as fileobj:
-        raw_contents = yaml.load(fileobj, Loader=yaml.Loader)
+    with path.open("rb") as fileobj:
+        raw_contents = yaml.load(fileobj, Loader=_SafeLoader)
 
     try:
         resolved = _resolve_collection_file(raw_contents, {"vars": vars}, path)
@@ -52,40 +62,40 @@ def read_collection_file(path, vars=None):
     return Collection(publication_schema=publication_schema, publications={})
 
 
-def _collection_file_schema():
-    """The dictconfig schema describing a valid collection file."""
-    return {
-        "type": "dict",
-        "required_keys": {
-            "publication_schema": {
-                "type": "dict",
-                "required_keys": {
-                    "required_artifacts": {
-                        "type": "list",
-                        "element_schema": {"type": "string"},
-                    }
+# the dictconfig schema describing a valid collection file. it is the same for every
+# collection file, so it is built once here rather than on every read
+_COLLECTION_FILE_SCHEMA = {
+    "type": "dict",
+    "required_keys": {
+        "publication_schema": {
+            "type": "dict",
+            "required_keys": {
+                "required_artifacts": {
+                    "type": "list",
+                    "element_schema": {"type": "string"},
+                }
+            },
+            "optional_keys": {
+                "optional_artifacts": {
+                    "type": "list",
+                    "element_schema": {"type": "string"},
+                    "default": [],
                 },
-                "optional_keys": {
-                    "optional_artifacts": {
-                        "type": "list",
-                        "element_schema": {"type": "string"},
-                        "default": [],
-                    },
-                    "metadata_schema": {
-                        "type": "dict",
-                        "extra_keys_schema": {"type": "any"},
-                        "default": None,
-                        "nullable": True,
-                    },
-                    "allow_unspecified_artifacts": {
-                        "type": "boolean",
-                        "default": False,
-                    },
-                    "is_ordered": {"type": "boolean", "default": False},
+                "metadata_schema": {
+                    "type": "dict",
+                    "extra_keys_schema": {"type": "any"},
+                    "default": None,
+                    "nullable": True,
                 },
-            }
-        },
-    }
+                "allow_unspecified_artifacts": {
+                    "type": "boolean",
+                    "default": False,
+                },
+                "is_ordered": {"type": "boolean", "default": False},
+            },
+        }
+    },
+}
 
 
 def _resolve_collection_file(raw_contents, external_variables, path):
@@ -112,11 +122,9 @@ def _resolve_collection_file(raw_contents, external_variables, path):
         If the collection file is invalid.
 
     """
-    schema = _collection_file_schema()
-
     try:
         resolved = dictconfig.resolve(
-            raw_contents, schema, external_variables=external_variables
+            raw_contents, _COLLECTION_FILE_SCHEMA, external_variables=external_variables
         )
     except dictconfig.exceptions.ResolutionError as exc:
         raise DiscoveryError(str(exc), path)
@@ -186,9 +194,21 @@ def read_publication_file(path, publication_schema=None, vars=None, previous=Non
     provided, :func:`validate` is called as a convenience.
 
     """
-    with path.open() as fileobj:
+    file_schema = _make_publication_file_schema(publication_schema)
+    return _read_publication_file(path, file_schema, vars, previous)
+
+
+def _read_publication_file(path, file_schema, vars, previous):
+    """Read a :class:`Publication` using an already-constructed file schema.
+
+    This is :func:`read_publication_file`, except that the dictconfig schema made by
+    :func:`_make_publication_file_schema` is passed in. This allows the schema to be
+    made once and reused for every publication in a collection.
+
+    """
+    with path.open("rb") as fileobj:
         try:
-            raw_contents = yaml.load(fileobj.read(), Loader=yaml.Loader)
+            raw_contents = yaml.load(fileobj, Loader=_SafeLoader)
         except yaml.YAMLError as exc:
             raise DiscoveryError(str(exc), path)
 
@@ -198,42 +218,74 @@ def read_publication_file(path, publication_schema=None, vars=None, previous=Non
         external_variables["previous"] = previous._deep_asdict()
 
     resolved = _resolve_publication_file(
-        raw_contents, publication_schema, external_variables, path
+        raw_contents, file_schema, external_variables, path
     )
 
     # convert each artifact to an Artifact object
-    artifacts = {}
-    for key, definition in resolved["artifacts"].items():
-        # if no file is provided, use the key
-        if definition["path"] is None:
-            definition["path"] = key
+    workdir = path.parent.absolute()
+    artifacts = {
+        _intern(key): _make_artifact(key, definition, workdir)
+        for key, definition in resolved["artifacts"].items()
+    }
 
-        artifacts[key] = UnbuiltArtifact(workdir=path.parent.absolute(), **definition)
+    metadata = resolved["metadata"]
+    if isinstance(metadata, dict):
+        metadata = {_intern(key): value for key, value in metadata.items()}
 
     publication = Publication(
-        metadata=resolved["metadata"],
+        metadata=metadata,
         artifacts=artifacts,
     )
 
     return publication
 
 
+def _intern(key):
+    """Intern a string key; other keys are returned unchanged.
+
+    The publications in a collection share the same artifact and metadata keys.
+    Interning them means that each distinct key is stored only once, and that
+    dictionary lookups with these keys can compare by identity.
+
+    """
+    if isinstance(key, str):
+        return sys.intern(key)
+    return key
+
+
+def _make_artifact(key, definition, workdir):
+    """Create an :class:`UnbuiltArtifact` from its resolved definition."""
+    # if no file is provided, use the key
+    if definition["path"] is None:
+        definition = {**definition, "path": key}
+
+    return UnbuiltArtifact(workdir=workdir, **definition)
+
+
+# the dictconfig schema describing a single artifact. it is shared by every
+# artifact key of every publication file schema
+_ARTIFACT_SCHEMA = {
+    "type": "dict",
+    "optional_keys": {
+        "path": {"type": "string", "nullable": True, "default": None},
+        "recipe": {"type": "string", "nullable": True, "default": None},
+        "ready": {"type": "boolean", "default": True},
+        "missing_ok": {"type": "boolean", "default": False},
+        "release_time": {"type": "datetime", "nullable": True, "default": None},
+    },
+}
+
+# the publication schema used when a publication is read without one
+_PERMISSIVE_PUBLICATION_SCHEMA = PublicationSchema([], allow_unspecified_artifacts=True)
+
+
 def _make_publication_file_schema(publication_schema):
     """Construct a dictconfig schema for validating and resolving the publication file."""
 
     if publication_schema is None:
-        publication_schema = PublicationSchema([], allow_unspecified_artifacts=True)
+        publication_schema = _PERMISSIVE_PUBLICATION_SCHEMA
 
-    artifact_schema = {
-        "type": "dict",
-        "optional_keys": {
-            "path": {"type": "string", "nullable": True, "default": None},
-            "recipe": {"type": "string", "nullable": True, "default": None},
-            "ready": {"type": "boolean", "default": True},
-            "missing_ok": {"type": "boolean", "default": False},
-            "release_time": {"type": "datetime", "nullable": True, "default": None},
-        },
-    }
+    artifact_schema = _ARTIFACT_SCHEMA
 
     artifacts_schema = {
         "type": "dict",
@@ -269,19 +321,16 @@ def _make_publication_file_schema(publication_schema):
     return schema
 
 
-def _resolve_publication_file(
-    raw_contents, publication_schema, external_variables, path
-):
+def _resolve_publication_file(raw_contents, file_schema, external_variables, path):
     """Resolves (interpolates and parses) the raw publication file contents.
 
     Parameters
     ----------
     raw_contents : dict
         The raw dictionary loaded from the publication file.
-    metadata_schema : Optional[dict]
-        A dictconfig schema for the "metadata" field of `raw_contents`. If this is
-        None, the schema passed to dictconfig will not have a "metadata" field,
-        and so it will not be interpolated/parsed (all leafs will be left as-is).
+    file_schema : dict
+        The dictconfig schema for the whole publication file, as made by
+        :func:`_make_publication_file_schema`.
     external_variables : Optional[dict]
         A dictionary of external_variables passed to dictconfig and used during
         interpolation. These are accessible under ${vars}
@@ -292,11 +341,9 @@ def _resolve_publication_file(
         The resolved dictionary.
 
     """
-    schema = _make_publication_file_schema(publication_schema)
-
     try:
         return dictconfig.resolve(
-            raw_contents, schema, external_variables=external_variables
+            raw_contents, file_schema, external_variables=external_variables
         )
     except dictconfig.exceptions.ResolutionError as exc:
         raise DiscoveryError(str(exc), path)
@@ -340,14 +387,34 @@ class DiscoverCallbacks:
         """
 
 
-def _is_collection(path):
-    """Determine if the path is a collection."""
-    return (path / constants.COLLECTION_FILE).is_file()
+def _scan_directory(path):
+    """Read the directory's entries, separating files from subdirectories.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The directory to scan.
+
+    Returns
+    -------
+    Set[str]
+        The names of the files in the directory.
+    List[str]
+        The names of the subdirectories of the directory.
 
+    """
+    # os.scandir reports the type of each entry along with its name, so this
+    # avoids a separate stat() for every path in the tree
+    file_names = set()
+    subdirectory_names = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirectory_names.append(entry.name)
+            elif entry.is_file():
+                file_names.add(entry.name)
 
-def _is_publication(path):
-    """Determine if the path is a publication."""
-    return (path / constants.PUBLICATION_FILE).is_file()
+    return file_names, subdirectory_names
 
 
 def _search_for_collections_and_publications(
@@ -381,8 +448,11 @@ def _search_for_collections_and_publications(
         If a nested collection is found.
 
     """
+    # the CLI passes a list; a set makes each membership test constant-time
     if skip_directories is None:
-        skip_directories = set()
+        skip_directories = frozenset()
+    else:
+        skip_directories = frozenset(skip_directories)
 
     if callbacks is None:
         callbacks = DiscoverCallbacks()
@@ -394,23 +464,24 @@ def _search_for_collections_and_publications(
 
     while queue:
         current_path, parent_collection_path = queue.pop()
+        file_names, subdirectory_names = _scan_directory(current_path)
 
-        if _is_collection(current_path):
+        if constants.COLLECTION_FILE in file_names:
             if parent_collection_path is not None:
                 raise DiscoveryError(f"Nested collection found.", current_path)
 
             collections.append(current_path)
             parent_collection_path = current_path
 
-        if _is_publication(current_path):
+        if constants.PUBLICATION_FILE in file_names:
             publications[current_path] = parent_collection_path
 
-        for subpath in current_path.iterdir():
-            if subpath.is_dir():
-                if subpath.name in skip_directories:
-                    callbacks.on_skip(subpath)
-                    continue
-                queue.append((subpath, parent_collection_path))
+        for name in subdirectory_names:
+            subpath = current_path / name
+            if name in skip_directories:
+                callbacks.on_skip(subpath)
+                continue
+            queue.append((subpath, parent_collection_path))
 
     return collections, publications
 
@@ -450,7 +521,7 @@ def _make_collections(collection_paths, input_directory, callbacks):
 
         collection = read_collection_file(file_path)
 
-        key = str(path.relative_to(input_directory))
+        key = sys.intern(str(path.relative_to(input_directory)))
         collections[key] = collection
 
         callbacks.on_collection(file_path)
@@ -464,10 +535,10 @@ def _previous_publication(collection):
     if not collection.publication_schema.is_ordered:
         return
 
-    # the previous publication was just the last one added to collection.publications
-    try:
-        previous_key = list(collection.publications)[-1]
-    except IndexError:
+    # the previous publication was just the last one added to collection.publications.
+    # reversed() reaches it directly, without copying every key into a list
+    previous_key = next(reversed(collection.publications), None)
+    if previous_key is None:
         return
 
     return collection.publications[previous_key]
@@ -502,6 +573,16 @@ def _make_publications(
     if vars is None:
         vars = {}
 
+    # the publications in a collection share its schema, so the dictconfig schema for
+    # their files is made once per collection rather than once per file
+    file_schemas = {
+        key: _make_publication_file_schema(collection.publication_schema)
+        for key, collection in collections.items()
+    }
+
+    # publications are read one at a time, in sorted order: in an ordered collection
+    # each publication is resolved against the one before it, and the callbacks
+    # report publications in the order that they are read
     for path, collection_path in publication_paths.items():
         if collection_path is None:
             collection_key = "default"
@@ -515,9 +596,9 @@ def _make_publications(
         previous = _previous_publication(collection)
 
         file_path = path / constants.PUBLICATION_FILE
-        publication = read_publication_file(
+        publication = _read_publication_file(
             file_path,
-            publication_schema=collection.publication_schema,
+            file_schemas[collection_key],
             vars=vars,
             previous=previous,
         )
@@ -528,10 +609,9 @@ def _make_publications(
 
 
 def _sort_dictionary(dct):
-    result = OrderedDict()
-    for key in sorted(dct):
-        result[key] = dct[key]
-    return result
+    # dicts preserve insertion order, so sorting the keys once here fixes the order
+    # in which the publications are read
+    return {key: dct[key] for key in sorted(dct)}
 
 
 def discover(
@@ -32,7 +32,8 @@ def filter_nodes(parent, predicate, remove_empty_nodes=False, callbacks=None):
     type(parent)
         An object of the same type as the parent, but wth all filtered nodes
         removed. Furthermore, if a node has no children after filtering, it
-        is removed.
+        is removed. Nodes from which nothing was removed are not copied; the
+        original node is included in the result.
 
     """
     # bottom up -- by the time the predicate is applied to publication, its artifacts
@@ -54,4 +55,10 @@ def filter_nodes(parent, predicate, remove_empty_nodes=False, callbacks=None):
 
     new_children = {k: v for (k, v) in new_children.items() if predicate(k, v)}
 
+    # if nothing beneath this node was removed, reuse it instead of building a copy
+    if len(new_children) == len(parent._children) and all(
+        new_children[k] is child for (k, child) in parent._children.items()
+    ):
+        return parent
+
     return parent._replace_children(new_children)
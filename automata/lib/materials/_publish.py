@@ -1,6 +1,5 @@
 import pathlib
 import shutil
-import re
 
 from .types import BuiltArtifact, PublishedArtifact
 
@@ -30,7 +29,8 @@ def _publish_artifact(built_artifact, outdir, filename, callbacks):
     else:
         shutil.copy(full_src, full_dst)
 
-    return PublishedArtifact(path=full_dst.relative_to(outdir))
+    # full_dst is outdir / filename, so its path relative to outdir is the filename
+    return PublishedArtifact(path=pathlib.Path(filename))
 
 
 def publish(parent, outdir, prefix="", callbacks=None):
@@ -75,7 +75,7 @@ def publish(parent, outdir, prefix="", callbacks=None):
     new_children = {}
     for child_key, child in parent._children.items():
         callbacks.on_publish(child_key, child)
-        new_prefix = pathlib.Path(prefix) / child_key
+        new_prefix = pathlib.Path(prefix, child_key)
         new_children[child_key] = publish(child, outdir, new_prefix, callbacks)
 
     return parent._replace_children(new_children)
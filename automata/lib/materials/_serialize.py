@@ -1,7 +1,12 @@
 import json
 import datetime
 
-from .types import Artifact, Publication, Collection, Universe
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .types import Artifact, Publication, Collection, Universe, _artifact_from_dict
 
 
 # serialization
@@ -34,15 +39,56 @@ def serialize(node):
     return json.dumps(dct, default=converter, indent=4)
 
 
+def _looks_like_time(s):
+    """Quickly check whether the string could be a date or datetime.
+
+    Dates and times are serialized in ISO 8601 extended format, so they begin with a
+    four digit year followed by a hyphen. Most strings do not, and this check lets
+    them skip the (comparatively slow) failed attempts at parsing.
+
+    """
+    return len(s) >= 10 and s[4] == "-" and s[:4].isdigit()
+
+
 def _convert_to_time(s):
-    converters = [datetime.date.fromisoformat, datetime.datetime.fromisoformat]
-    for converter in converters:
+    """Parse a date or datetime in ISO 8601 format. Raises ValueError if invalid."""
+    # no ISO date is longer than ten characters; anything longer must include a time,
+    # so only one parser needs to be tried
+    if len(s) <= 10:
+        return datetime.date.fromisoformat(s)
+    return datetime.datetime.fromisoformat(s)
+
+
+def _maybe_time(v):
+    """Convert v to a date/datetime if it is a datestring, else return it unchanged."""
+    if isinstance(v, str) and _looks_like_time(v):
         try:
-            return converter(s)
+            return _convert_to_time(v)
         except ValueError:
-            continue
-    else:
-        raise ValueError("Not a time.")
+            pass
+    return v
+
+
+def _times_hook(pairs):
+    """Hook for json.loads to convert date/time-like values."""
+    return {k: _maybe_time(v) for k, v in pairs}
+
+
+def _convert_times(obj):
+    """Recursively convert the date/time-like values of every dict within obj.
+
+    This has the same effect as decoding with :func:`_times_hook` as the
+    ``object_pairs_hook``: only values of objects are converted, not bare list items.
+
+    """
+    if isinstance(obj, dict):
+        return {
+            k: _convert_times(v) if isinstance(v, (dict, list)) else _maybe_time(v)
+            for k, v in obj.items()
+        }
+    elif isinstance(obj, list):
+        return [_convert_times(x) if isinstance(x, (dict, list)) else x for x in obj]
+    return obj
 
 
 def deserialize(s):
@@ -58,23 +104,25 @@ def deserialize(s):
     Universe/Collection/Publication/Artifact
         The reconstructed object; its type is inferred from the string.
 
+    Note
+    ----
+    If the optional ``orjson`` package is installed, it is used to decode the
+    JSON. orjson is stricter than the standard library's decoder (it rejects
+    ``NaN``, for instance), so the standard library is used when it fails.
+
     """
-    # we need to pass a hook to json.loads in order to automatically convert
-    # datestring to date/datetime objects
-    def hook(pairs):
-        """Hook for json.loads to convert date/time-like values."""
-        d = {}
-        for k, v in pairs:
-            if isinstance(v, str):
-                try:
-                    d[k] = _convert_to_time(v)
-                except ValueError:
-                    d[k] = v
-            else:
-                d[k] = v
-        return d
-
-    dct = json.loads(s, object_pairs_hook=hook)
+    dct = None
+    if orjson is not None:
+        try:
+            # orjson has no object hook, so datestrings are converted in a second pass
+            dct = _convert_times(orjson.loads(s))
+        except orjson.JSONDecodeError:
+            pass
+
+    if dct is None:
+        # we need to pass a hook to json.loads in order to automatically convert
+        # datestring to date/datetime objects
+        dct = json.loads(s, object_pairs_hook=_times_hook)
 
     # infer what we're reconstructing
     if "collections" in dct:
@@ -1,5 +1,14 @@
+import copy
+
 import yaml
 
+# the safe loader implemented in C by libyaml is much faster than the pure Python
+# one, but it is only available if PyYAML was built with libyaml
+try:
+    SafeLoader = yaml.CSafeLoader
+except AttributeError:
+    SafeLoader = yaml.SafeLoader
+
 
 def load_yaml(path):
     """Read a YAML file. Supports including other yaml files.
@@ -30,16 +39,40 @@ def load_yaml(path):
         announcements: !include announcements.yaml
 
     """
-    with path.open() as fileobj:
-        raw_yaml = fileobj.read()
+    return _load_including(path.read_bytes(), root=path.parent, included={})
+
+
+class _IncludingLoader(SafeLoader):
+    """A safe loader that understands the ``!include`` tag.
+
+    Included paths are relative to ``root``. ``included`` maps the resolved paths of
+    files that have already been included to their loaded contents.
+
+    """
+
+    def __init__(self, stream, root, included):
+        super().__init__(stream)
+        self.root = root
+        self.included = included
+
+    def include(self, node):
+        # files included more than once are read only once. every inclusion gets its
+        # own copy, so that changing one part of the config leaves the others alone
+        included_path = (self.root / self.construct_scalar(node)).resolve()
+        if included_path not in self.included:
+            self.included[included_path] = _load_including(
+                included_path.read_bytes(), self.root, self.included
+            )
+        return copy.deepcopy(self.included[included_path])
+
 
-    # we'll subclass yaml.Loader and add a constructor
-    class IncludingLoader(yaml.Loader):
-        def include(self, node):
-            included_path = path.parent / self.construct_scalar(node)
-            with included_path.open() as fileobj:
-                return yaml.load(fileobj, IncludingLoader)
+_IncludingLoader.add_constructor("!include", _IncludingLoader.include)
 
-    IncludingLoader.add_constructor("!include", IncludingLoader.include)
 
-    return yaml.load(raw_yaml, Loader=IncludingLoader)
+def _load_including(data, root, included):
+    """Load YAML with an :class:`_IncludingLoader`, as yaml.load would."""
+    loader = _IncludingLoader(data, root, included)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
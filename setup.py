@@ -6,6 +6,7 @@ setup(
     version="0.0.0",
     packages=find_packages(),
     install_requires=["pyyaml", "jinja2"],
+    extras_require={"fast": ["orjson"]},
     tests_require=["pytest"],
     entry_points={
         "console_scripts": [
@@ -2,14 +2,21 @@ import pathlib
 from textwrap import dedent
 
 from pytest import fixture
+import yaml
 
 
-@fixture
-def write_file(tmpdir):
-    tmpdir = pathlib.Path(tmpdir)
+def pytest_report_header(config):
+    if not yaml.__with_libyaml__:
+        return "warning: PyYAML was built without libyaml; YAML parsing will be slow"
+
 
+@fixture
+def write_file(tmp_path):
+    # files are written to a per-test directory rather than shared between tests
+    # with the same contents: tests such as those of !include write several files
+    # that must end up side by side
     def inner(filename, contents):
-        path = tmpdir / filename
+        path = tmp_path / filename
         with path.open("w") as fileobj:
             fileobj.write(contents)
         return path
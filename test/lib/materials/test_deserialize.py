@@ -1,11 +1,25 @@
 import json
 import datetime
+import math
 import pathlib
 
+from pytest import fixture, skip
+
 import automata.lib.materials
+from automata.lib.materials import _serialize
+
 
+@fixture(params=["orjson", "json"])
+def decoder(request, monkeypatch):
+    """Run the test with both decoders: orjson, if installed, and the json module."""
+    if request.param == "orjson" and _serialize.orjson is None:
+        skip("orjson is not installed")
+    if request.param == "json":
+        monkeypatch.setattr(_serialize, "orjson", None)
+    return request.param
 
-def test_serialize_deserialize_universe_roundtrip():
+
+def test_serialize_deserialize_universe_roundtrip(decoder):
     # given
     collection = automata.lib.materials.Collection(
         publication_schema=automata.lib.materials.PublicationSchema(
@@ -33,7 +47,7 @@ def test_serialize_deserialize_universe_roundtrip():
     assert original == result
 
 
-def test_serialize_deserialize_built_publication_roundtrip():
+def test_serialize_deserialize_built_publication_roundtrip(decoder):
     # given
     publication = automata.lib.materials.Publication(
         metadata={
@@ -56,6 +70,80 @@ def test_serialize_deserialize_built_publication_roundtrip():
     assert publication == result
 
 
+def test_serialize_deserialize_published_artifact_roundtrip(decoder):
+    # given
+    artifact = automata.lib.materials.PublishedArtifact("foo/bar")
+
+    # when
+    s = automata.lib.materials.serialize(artifact)
+    result = automata.lib.materials.deserialize(s)
+
+    # then
+    assert artifact == result
+
+
+def test_serialize_deserialize_nested_dates_roundtrip(decoder):
+    # given
+    publication = automata.lib.materials.Publication(
+        metadata={
+            "name": "testing",
+            "parts": [
+                {"due": datetime.datetime(2020, 2, 28, 23, 59, 0)},
+                [{"released": datetime.date(2020, 2, 28)}],
+            ],
+            "lecture": {"dates": {"first": datetime.date(2020, 3, 2)}},
+        },
+        artifacts={"homework": automata.lib.materials.PublishedArtifact("foo/bar")},
+    )
+
+    # when
+    s = automata.lib.materials.serialize(publication)
+    result = automata.lib.materials.deserialize(s)
+
+    # then
+    assert publication == result
+
+
+def test_deserialize_accepts_nan(decoder):
+    # given
+    publication = automata.lib.materials.Publication(
+        metadata={"weight": float("nan"), "due": datetime.date(2020, 2, 28)},
+        artifacts={"homework": automata.lib.materials.PublishedArtifact("foo/bar")},
+    )
+
+    # when
+    s = automata.lib.materials.serialize(publication)
+    result = automata.lib.materials.deserialize(s)
+
+    # then
+    assert math.isnan(result.metadata["weight"])
+    assert result.metadata["due"] == datetime.date(2020, 2, 28)
+
+
+def test_serialize_output_does_not_depend_on_orjson(monkeypatch):
+    # given
+    publication = automata.lib.materials.Publication(
+        metadata={
+            "name": "d\u00e9j\u00e0 vu",
+            "weight": float("nan"),
+            "points": 2**70,
+            "due": datetime.datetime(2020, 2, 28, 23, 59, 0),
+        },
+        artifacts={"homework": automata.lib.materials.PublishedArtifact("foo/bar")},
+    )
+
+    # when
+    with_orjson = automata.lib.materials.serialize(publication)
+    monkeypatch.setattr(_serialize, "orjson", None)
+    without_orjson = automata.lib.materials.serialize(publication)
+
+    # then
+    assert with_orjson == without_orjson
+    assert json.loads(with_orjson, parse_constant=str) == json.loads(
+        without_orjson, parse_constant=str
+    )
+
+
 # misc.
 # --------------------------------------------------------------------------------------
 
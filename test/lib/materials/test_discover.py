@@ -37,17 +37,28 @@ EXAMPLE_8_DIRECTORY = EXAMPLES_ROOT / "example_8"
 EXAMPLE_9_DIRECTORY = EXAMPLES_ROOT / "example_9"
 
 
-def test_finds_collections():
-    # when
-    universe = discover(EXAMPLE_1_DIRECTORY)
+@fixture(scope="module")
+def example_1_universe():
+    """The universe discovered in example_1. Discovered once for the module.
+
+    The tests using this fixture only read from the universe; tests that need to
+    modify it should call discover themselves.
+
+    """
+    return discover(EXAMPLE_1_DIRECTORY)
+
+
+def test_finds_collections(example_1_universe):
+    # given
+    universe = example_1_universe
 
     # then
     assert universe.collections.keys() == {"homeworks", "default"}
 
 
-def test_finds_publications():
-    # when
-    universe = discover(EXAMPLE_1_DIRECTORY)
+def test_finds_publications(example_1_universe):
+    # given
+    universe = example_1_universe
 
     # then
     assert universe.collections["homeworks"].publications.keys() == {
@@ -58,10 +69,12 @@ def test_finds_publications():
     }
 
 
-def test_finds_singleton_publications_and_places_them_in_default_collection():
+def test_finds_singleton_publications_and_places_them_in_default_collection(
+    example_1_universe,
+):
     # a "singleton" is a publication that does not exist in a collection
-    # when
-    universe = discover(EXAMPLE_1_DIRECTORY)
+    # given
+    universe = example_1_universe
 
     # then
     assert universe.collections["default"].publications.keys() == {
@@ -69,9 +82,9 @@ def test_finds_singleton_publications_and_places_them_in_default_collection():
     }
 
 
-def test_reads_publication_metadata():
-    # when
-    universe = discover(EXAMPLE_1_DIRECTORY)
+def test_reads_publication_metadata(example_1_universe):
+    # given
+    universe = example_1_universe
 
     # then
     assert (
@@ -80,9 +93,9 @@ def test_reads_publication_metadata():
     )
 
 
-def test_loads_artifacts():
-    # when
-    universe = discover(EXAMPLE_1_DIRECTORY)
+def test_loads_artifacts(example_1_universe):
+    # given
+    universe = example_1_universe
 
     # then
     assert (
@@ -94,9 +107,9 @@ def test_loads_artifacts():
     )
 
 
-def test_loads_dates_as_dates():
-    # when
-    universe = discover(EXAMPLE_1_DIRECTORY)
+def test_loads_dates_as_dates(example_1_universe):
+    # given
+    universe = example_1_universe
 
     # then
     assert isinstance(
@@ -110,9 +123,9 @@ def test_loads_dates_as_dates():
     )
 
 
-def test_reads_ready():
-    # when
-    universe = discover(EXAMPLE_1_DIRECTORY)
+def test_reads_ready(example_1_universe):
+    # given
+    universe = example_1_universe
 
     # then
     assert (
@@ -161,9 +174,9 @@ def test_skip_directories():
     assert "textbook" not in universe.collections["default"].publications
 
 
-def test_key_used_for_path_if_path_not_provided():
-    # when
-    universe = discover(EXAMPLE_1_DIRECTORY)
+def test_key_used_for_path_if_path_not_provided(example_1_universe):
+    # given
+    universe = example_1_universe
 
     # then
     assert (
@@ -1,5 +1,7 @@
 import pathlib
 
+from pytest import mark
+
 from automata.lib.materials import discover, UnbuiltArtifact, filter_nodes
 
 
@@ -62,3 +64,25 @@ def test_preserves_nodes_without_children_by_default():
 
     # then
     assert "homeworks" in universe.collections
+
+
+@mark.private
+def test_reuses_nodes_from_which_nothing_was_removed():
+    # when
+    universe = discover(EXAMPLE_1_DIRECTORY)
+
+    def keep(k, v):
+        if not isinstance(v, UnbuiltArtifact):
+            return True
+
+        return k != "solution.pdf"
+
+    filtered = filter_nodes(universe, keep)
+
+    # then
+    # 01-intro loses its solution, so it is copied. the default collection only
+    # contains the textbook, which has no solution, so it is reused as-is
+    homeworks = universe.collections["homeworks"].publications
+    filtered_homeworks = filtered.collections["homeworks"].publications
+    assert filtered_homeworks["01-intro"] is not homeworks["01-intro"]
+    assert filtered.collections["default"] is universe.collections["default"]
@@ -23,36 +23,40 @@ def outdir(tmpdir):
     outdir.mkdir()
     return outdir
 
-@fixture
-def example_course(example_course_factory, tmpdir):
-    default_collection_yaml = dedent("""
-        publication_schema:
-            required_artifacts:
-                - homework.pdf
 
-            optional_artifacts:
-                - template.zip
+_DEFAULT_COLLECTION_YAML = dedent("""
+    publication_schema:
+        required_artifacts:
+            - homework.pdf
 
-            metadata_schema:
-                required_keys:
-                  name:
-                      type: string
-                  date:
-                      type: datetime
+        optional_artifacts:
+            - template.zip
 
-            is_ordered: true
-    """)
+        metadata_schema:
+            required_keys:
+              name:
+                  type: string
+              date:
+                  type: datetime
+
+        is_ordered: true
+""")
+
+_DEFAULT_PUBLICATION_YAML = dedent("""
+    artifacts:
+        homework.pdf:
+            recipe: touch homework.pdf
+    metadata:
+        name: Homework
+        date: 2021-10-05 23:59:00
+""")
 
-    default_publication_yaml = dedent("""
-        artifacts:
-            homework.pdf:
-                recipe: touch homework.pdf
-        metadata:
-            name: Homework
-            date: 2021-10-05 23:59:00
-    """)
 
-    return example_course_factory(tmpdir, default_collection_yaml, default_publication_yaml)
+@fixture
+def example_course(example_course_factory, tmpdir):
+    return example_course_factory(
+        tmpdir, _DEFAULT_COLLECTION_YAML, _DEFAULT_PUBLICATION_YAML
+    )
 
 
 def test_publish(example_1, outdir):
@@ -217,181 +217,43 @@ def test_with_relative_release_date_but_no_time_raises(write_file):
         publication = read_publication_file(path)
 
 
-def test_with_relative_release_time_after(write_file):
-    # given
-    path = write_file(
-        "publication.yaml",
-        contents=dedent(
-            """
-            metadata:
-                name: Homework 01
-                due: 2020-09-04 23:59:00
-                released: 2020-09-01
-
-            artifacts:
-                homework:
-                    path: ./homework.pdf
-                    recipe: make homework
-                solution:
-                    path: ./solution.pdf
-                    recipe: make solution
-                    release_time: 1 day after ${this.metadata.due}
-            """
-        ),
-    )
-
-    # when
-    publication = read_publication_file(path)
-
-    # then
-    expected = publication.metadata["due"] + datetime.timedelta(days=1)
-    assert publication.artifacts["solution"].release_time == expected
-
-
-def test_with_relative_release_time_after_hours(write_file):
-    # given
-    path = write_file(
-        "publication.yaml",
-        contents=dedent(
-            """
-            metadata:
-                name: Homework 01
-                due: 2020-09-04 23:59:00
-                released: 2020-09-01
-
-            artifacts:
-                homework:
-                    path: ./homework.pdf
-                    recipe: make homework
-                solution:
-                    path: ./solution.pdf
-                    recipe: make solution
-                    release_time: 3 hours after ${this.metadata.due}
-            """
-        ),
-    )
-
-    # when
-    publication = read_publication_file(path)
-
-    # then
-    expected = publication.metadata["due"] + datetime.timedelta(hours=3)
-    assert publication.artifacts["solution"].release_time == expected
-
-
-def test_with_relative_release_time_after_large(write_file):
-    # given
-    path = write_file(
-        "publication.yaml",
-        contents=dedent(
-            """
-            metadata:
-                name: Homework 01
-                due: 2020-09-04 23:59:00
-                released: 2020-09-01
-
-            artifacts:
-                homework:
-                    path: ./homework.pdf
-                    recipe: make homework
-                solution:
-                    path: ./solution.pdf
-                    recipe: make solution
-                    release_time: 11 days after ${this.metadata.due}
-            """
-        ),
-    )
-
-    # when
-    publication = read_publication_file(path)
-
-    # then
-    expected = publication.metadata["due"] + datetime.timedelta(days=11)
-    assert publication.artifacts["solution"].release_time == expected
-
-
-def test_with_relative_release_time_after_large_hours(write_file):
-    # given
-    path = write_file(
-        "publication.yaml",
-        contents=dedent(
-            """
-            metadata:
-                name: Homework 01
-                due: 2020-09-04 23:59:00
-                released: 2020-09-01
-
-            artifacts:
-                homework:
-                    path: ./homework.pdf
-                    recipe: make homework
-                solution:
-                    path: ./solution.pdf
-                    recipe: make solution
-                    release_time: 1000 hours after ${this.metadata.due}
-            """
-        ),
-    )
-
-    # when
-    publication = read_publication_file(path)
-
-    # then
-    expected = publication.metadata["due"] + datetime.timedelta(hours=1000)
-    assert publication.artifacts["solution"].release_time == expected
-
-
-def test_with_relative_release_date_before(write_file):
-    # given
-    path = write_file(
-        "publication.yaml",
-        contents=dedent(
-            """
-            metadata:
-                name: Homework 01
-                due: 2020-09-04 23:59:00
-                released: 2020-09-01
-
-            artifacts:
-                homework:
-                    path: ./homework.pdf
-                    recipe: make homework
-                solution:
-                    path: ./solution.pdf
-                    recipe: make solution
-                    release_time: 3 days before ${this.metadata.due}
-            """
-        ),
-    )
-
-    # when
-    publication = read_publication_file(path)
-
-    # then
-    expected = publication.metadata["due"] - datetime.timedelta(days=3)
-    assert publication.artifacts["solution"].release_time == expected
+_PUBLICATION_WITH_SOLUTION_RELEASE_TIME = dedent(
+    """
+    metadata:
+        name: Homework 01
+        due: 2020-09-04 23:59:00
+        released: 2020-09-01
+
+    artifacts:
+        homework:
+            path: ./homework.pdf
+            recipe: make homework
+        solution:
+            path: ./solution.pdf
+            recipe: make solution
+            release_time: {release_time}
+    """
+)
 
 
-def test_with_relative_release_date_before_hours(write_file):
+@mark.parametrize(
+    "release_time, delta",
+    [
+        ("1 day after ${this.metadata.due}", datetime.timedelta(days=1)),
+        ("3 hours after ${this.metadata.due}", datetime.timedelta(hours=3)),
+        ("11 days after ${this.metadata.due}", datetime.timedelta(days=11)),
+        ("1000 hours after ${this.metadata.due}", datetime.timedelta(hours=1000)),
+        ("3 days before ${this.metadata.due}", -datetime.timedelta(days=3)),
+        ("3 hours before ${this.metadata.due}", -datetime.timedelta(hours=3)),
+        ("3 days after ${this.metadata.due}", datetime.timedelta(days=3)),
+    ],
+)
+def test_with_relative_release_time_offset(write_file, release_time, delta):
     # given
     path = write_file(
         "publication.yaml",
-        contents=dedent(
-            """
-            metadata:
-                name: Homework 01
-                due: 2020-09-04 23:59:00
-                released: 2020-09-01
-
-            artifacts:
-                homework:
-                    path: ./homework.pdf
-                    recipe: make homework
-                solution:
-                    path: ./solution.pdf
-                    recipe: make solution
-                    release_time: 3 hours before ${this.metadata.due}
-            """
+        contents=_PUBLICATION_WITH_SOLUTION_RELEASE_TIME.format(
+            release_time=release_time
         ),
     )
 
@@ -399,91 +261,25 @@ def test_with_relative_release_date_before_hours(write_file):
     publication = read_publication_file(path)
 
     # then
-    expected = publication.metadata["due"] - datetime.timedelta(hours=3)
+    expected = publication.metadata["due"] + delta
     assert publication.artifacts["solution"].release_time == expected
 
 
-def test_with_relative_release_time_multiple_days(write_file):
-    # given
-    path = write_file(
-        "publication.yaml",
-        contents=dedent(
-            """
-            metadata:
-                name: Homework 01
-                due: 2020-09-04 23:59:00
-                released: 2020-09-01
-
-            artifacts:
-                homework:
-                    path: ./homework.pdf
-                    recipe: make homework
-                solution:
-                    path: ./solution.pdf
-                    recipe: make solution
-                    release_time: 3 days after ${this.metadata.due}
-            """
-        ),
-    )
-
-    # when
-    publication = read_publication_file(path)
-
-    # then
-    expected = publication.metadata["due"] + datetime.timedelta(days=3)
-    assert publication.artifacts["solution"].release_time == expected
-
-
-def test_with_invalid_relative_date_raises(write_file):
-    # given
-    path = write_file(
-        "publication.yaml",
-        contents=dedent(
-            """
-            metadata:
-                name: Homework 01
-                due: 2020-09-04 23:59:00
-                released: 2020-09-01
-
-            artifacts:
-                homework:
-                    path: ./homework.pdf
-                    recipe: make homework
-                solution:
-                    path: ./solution.pdf
-                    recipe: make solution
-                    release_time: -1 days after ${this.metadata.due}
-            """
-        ),
-    )
-
-    # when
-    with raises(DiscoveryError):
-        publication = read_publication_file(path)
-
-
-def test_with_invalid_relative_date_variable_reference_raises(
-    write_file,
-):
+@mark.parametrize(
+    "release_time",
+    [
+        # negative offsets are not allowed
+        "-1 days after ${this.metadata.due}",
+        # the referenced field does not exist
+        "1 days after ${this.metadata.foo}",
+    ],
+)
+def test_with_invalid_relative_release_time_raises(write_file, release_time):
     # given
     path = write_file(
         "publication.yaml",
-        contents=dedent(
-            """
-            metadata:
-                name: Homework 01
-                due: 2020-09-04 23:59:00
-                released: 2020-09-01
-
-            artifacts:
-                homework:
-                    path: ./homework.pdf
-                    recipe: make homework
-                solution:
-                    path: ./solution.pdf
-                    recipe: make solution
-                    release_time: 1 days after ${this.metadata.foo}
-            """
+        contents=_PUBLICATION_WITH_SOLUTION_RELEASE_TIME.format(
+            release_time=release_time
         ),
     )
 
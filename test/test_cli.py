@@ -1,5 +1,6 @@
 from automata.cli import cli
 
+import os
 import shutil
 import json
 import pathlib
@@ -7,30 +8,73 @@ from textwrap import dedent
 
 from pytest import fixture, mark
 
+# the examples are named by their paths relative to this directory
+_TEST_DIRECTORY = pathlib.Path(__file__).resolve().parent
+
+
+def _link_or_copy(src, dst):
+    """Hard link a file, copying it instead if a link can't be made."""
+    # the tests only add new files to the input directory, they never write to
+    # the existing ones, so it is safe for the files to share their contents
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+@fixture(scope="session")
+def example_cache(tmp_path_factory):
+    """Copies of the example directories, each made once per session.
+
+    The input directories of the tests link to these copies, and not to the
+    files in the repository.
+
+    """
+    cache_path = tmp_path_factory.mktemp("examples")
+    copies = {}
+
+    def example_cache(example):
+        if example not in copies:
+            copy_path = cache_path / str(len(copies))
+            shutil.copytree(_TEST_DIRECTORY / example, copy_path)
+            copies[example] = copy_path
+        return copies[example]
+
+    return example_cache
+
+
+def _clone(source, destination):
+    """Clone a directory tree, hard linking its files."""
+    shutil.copytree(source, destination, copy_function=_link_or_copy)
+
 
 @fixture
-def make_input_directory(tmpdir):
+def make_input_directory(tmp_path, example_cache):
     def make_input_directory(example):
-        input_path = pathlib.Path(tmpdir) / "input"
-        example_path = pathlib.Path(__file__).parent / example
-        shutil.copytree(example_path, input_path)
+        input_path = tmp_path / "input"
+        _clone(example_cache(example), input_path)
         return input_path
 
     return make_input_directory
 
 
 @fixture
-def output_directory(tmpdir):
-    output_path = pathlib.Path(tmpdir) / "output"
+def output_directory(tmp_path):
+    output_path = tmp_path / "output"
     output_path.mkdir()
     return output_path
 
 
-def test_publish_materials_simple_example(make_input_directory, output_directory):
-    # given
-    input_directory = make_input_directory("examples/example_1")
+@fixture(scope="session")
+def published_example_1(tmp_path_factory, example_cache):
+    """The output directory of publishing example_1. Published once per session."""
+    path = tmp_path_factory.mktemp("published_example_1")
+    input_directory = path / "input"
+    output_directory = path / "output"
+
+    _clone(example_cache("examples/example_1"), input_directory)
+    output_directory.mkdir()
 
-    # when
     cli(
         [
             "materials",
@@ -41,8 +85,21 @@ def test_publish_materials_simple_example(make_input_directory, output_directory
         ]
     )
 
+    return output_directory
+
+
+def test_publish_materials_simple_example(published_example_1):
     # then
-    assert (output_directory / "homeworks" / "01-intro" / "homework.pdf").exists()
+    assert (published_example_1 / "homeworks" / "01-intro" / "homework.pdf").exists()
+
+
+_EXAMPLE_9_VARS = dedent(
+    """
+    course:
+        name: this is a test
+        start_date: 2020-01-01
+    """
+)
 
 
 def test_publish_materials_with_example_using_external_variables(
@@ -51,15 +108,8 @@ def test_publish_materials_with_example_using_external_variables(
     # given
     input_directory = make_input_directory("examples/example_9")
 
-    contents = dedent(
-        """
-        course:
-            name: this is a test
-            start_date: 2020-01-01
-    """
-    )
     with (input_directory / "myvars.yaml").open("w") as fileobj:
-        fileobj.write(contents)
+        fileobj.write(_EXAMPLE_9_VARS)
 
     # when
     cli(
@@ -79,25 +129,11 @@ def test_publish_materials_with_example_using_external_variables(
     assert (output_directory / "homeworks" / "01-intro").exists()
 
 
-def test_publish_materials_creates_materials_json(
-    make_input_directory, output_directory
-):
-    input_directory = make_input_directory("examples/example_1")
-
-    # when
-    cli(
-        [
-            "materials",
-            "publish",
-            "--input-directory",
-            str(input_directory),
-            str(output_directory),
-        ]
-    )
-
+def test_publish_materials_creates_materials_json(published_example_1):
     # then
-    assert (output_directory / "materials.json").exists()
-    released = json.load((output_directory / "materials.json").open())
+    assert (published_example_1 / "materials.json").exists()
+    with (published_example_1 / "materials.json").open("rb") as fileobj:
+        released = json.load(fileobj)
 
     # assert that an unreleased artifact is still present in materials.json
     assert (
@@ -1,24 +1,8 @@
 from textwrap import dedent
-import pathlib
-
-from pytest import fixture
 
 from automata import util
 
 
-@fixture
-def write_file(tmpdir):
-    tmpdir = pathlib.Path(tmpdir)
-
-    def inner(name, contents):
-        path = tmpdir / name
-        with path.open("w") as fileobj:
-            fileobj.write(contents)
-        return path
-
-    return inner
-
-
 def test_load_yaml_understands_include_directive(write_file):
     # given
     config_yaml = dedent(
@@ -54,3 +38,23 @@ def test_load_yaml_understands_include_directive(write_file):
     # then
     assert config["foo"]["x"] == 1
     assert config["testing"]["bar"] == [1, 2, 3]
+
+
+def test_load_yaml_allows_a_file_to_be_included_twice(write_file):
+    # given
+    config_yaml = dedent(
+        """
+        first: !include foo.yaml
+        second: !include ./foo.yaml
+        """
+    )
+
+    path = write_file("config.yaml", config_yaml)
+    write_file("foo.yaml", "x: 1")
+
+    # when
+    config = util.load_yaml(path)
+
+    # then
+    assert config["first"] == {"x": 1}
+    assert config["second"] == {"x": 1}